@@ -83,16 +83,28 @@ class BaseCache:
             logger.debug(e, exc_info=True)
             return default
 
-    def save_response(self, response: AnyResponse, cache_key: str = None, expires: datetime = None):
+    def save_response(
+        self,
+        response: AnyResponse,
+        cache_key: str = None,
+        expires: datetime = None,
+        copy: bool = True,
+    ):
         """Save a response to the cache
 
         Args:
             cache_key: Cache key for this response; will otherwise be generated based on request
             response: Response to save
             expires: Absolute expiration time for this response
+            copy: If ``response`` is already a ``CachedResponse``, save a copy of it. Set to
+                ``False`` to update and save it in place instead.
         """
         cache_key = cache_key or self.create_key(response.request)
-        cached_response = CachedResponse.from_response(response, expires=expires)
+        if isinstance(response, CachedResponse) and not copy:
+            cached_response = response
+            cached_response.expires = expires
+        else:
+            cached_response = CachedResponse.from_response(response, expires=expires)
         cached_response = redact_response(cached_response, self.ignored_parameters)
         self.responses[cache_key] = cached_response
         for r in response.history:
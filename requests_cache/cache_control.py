@@ -12,12 +12,16 @@ the majority of the caching policy, and resulting actions are handled in
 """
 from __future__ import annotations
 
+import re
 from datetime import datetime, timedelta, timezone
 from email.utils import parsedate_to_datetime
-from fnmatch import fnmatch
+from fnmatch import translate
+from functools import lru_cache
 from logging import getLogger
 from math import ceil
-from typing import TYPE_CHECKING, Any, Dict, MutableMapping, Optional, Tuple, Union
+from sys import intern
+from typing import TYPE_CHECKING, Any, Dict, List, MutableMapping, Optional, Tuple, Union
+from urllib.parse import urlsplit
 
 from attr import define, field
 from requests import PreparedRequest, Response
@@ -25,7 +29,7 @@ from requests.models import CaseInsensitiveDict
 
 from ._utils import coalesce
 
-__all__ = ['DO_NOT_CACHE', 'CacheActions']
+__all__ = ['DO_NOT_CACHE', 'CacheActions', 'UrlPatternSet']
 if TYPE_CHECKING:
     from .models import CachedResponse
 
@@ -36,6 +40,39 @@ NEVER_EXPIRE = -1
 CacheDirective = Union[None, int, bool]
 ExpirationTime = Union[None, int, float, str, datetime, timedelta]
 ExpirationPatterns = Dict[str, ExpirationTime]
+PatternRule = Tuple[int, str, re.Pattern, ExpirationTime]
+
+# Bit flags for key-only directives, so they can be checked without dict lookups
+_NO_CACHE = 1
+_NO_STORE = 2
+_IMMUTABLE = 4
+_ONLY_IF_CACHED = 8
+_MUST_REVALIDATE = 16
+# Keys are interned, along with parsed directive keys, so lookups can match by identity
+_DIRECTIVE_FLAGS = {
+    intern(k): v
+    for k, v in {
+        'no-cache': _NO_CACHE,
+        'no-store': _NO_STORE,
+        'immutable': _IMMUTABLE,
+        'only-if-cached': _ONLY_IF_CACHED,
+        'must-revalidate': _MUST_REVALIDATE,
+    }.items()
+}
+
+# Preferred HTTP date format (RFC 7231 IMF-fixdate), e.g.: 'Sun, 06 Nov 1994 08:49:37 GMT'
+_IMF_FIXDATE = re.compile(
+    r'\w{3}, (?P<day>\d{2}) (?P<month>\w{3}) (?P<year>\d{4}) '
+    r'(?P<hour>\d{2}):(?P<minute>\d{2}):(?P<second>\d{2}) GMT$'
+)
+_MONTHS = {
+    month: i
+    for i, month in enumerate(
+        ['jan', 'feb', 'mar', 'apr', 'may', 'jun', 'jul', 'aug', 'sep', 'oct', 'nov', 'dec'], 1
+    )
+}
+# Characters that end the host part of a URL without a protocol
+_HOST_DELIMITERS = re.compile('[/?#]')
 
 logger = getLogger(__name__)
 
@@ -68,10 +105,11 @@ class CacheActions:
     expire_after: ExpirationTime = field(default=None)
     only_if_cached: bool = field(default=False)
     request_directives: Dict[str, CacheDirective] = field(factory=dict)
+    request_flags: int = field(default=0)
     revalidate: bool = field(default=False)
     skip_read: bool = field(default=False)
     skip_write: bool = field(default=False)
-    validation_headers: Dict[str, str] = field(factory=dict)
+    _validation_headers: Optional[Dict[str, str]] = field(default=None)
 
     @classmethod
     def from_request(
@@ -98,25 +136,43 @@ class CacheActions:
           ``request()`` and ``send()``.
         """
         request.headers = request.headers or CaseInsensitiveDict()
-        directives = get_cache_directives(request.headers)
+        if not (
+            cache_control
+            or urls_expire_after
+            or 'Cache-Control' in request.headers
+            or 'requests-cache-refresh' in request.headers
+        ):
+            return cls._from_settings(
+                cache_key,
+                session_expire_after,
+                request_expire_after,
+                only_if_cached,
+                refresh,
+                revalidate,
+            )
+
+        directives, flags = parse_cache_directives(request.headers)
         logger.debug(f'Cache directives from request headers: {directives}')
 
-        # Check expiration values in order of precedence
-        expire_after = coalesce(
-            directives.get('max-age'),
-            request_expire_after,
-            get_url_expiration(request.url, urls_expire_after),
-            session_expire_after,
-        )
+        # Check expiration values in order of precedence. Checked one at a time instead of with
+        # coalesce(), so URL patterns are only matched if there's no higher-precedence value.
+        max_age = directives.get('max-age')
+        expire_after = max_age
+        if expire_after is None:
+            expire_after = request_expire_after
+        if expire_after is None:
+            expire_after = get_url_expiration(request.url, urls_expire_after)
+        if expire_after is None:
+            expire_after = session_expire_after
 
         # Check conditions for cache read and write based on args and request headers
         refresh_temp_header = request.headers.pop('requests-cache-refresh', False)
-        check_expiration = directives.get('max-age') if cache_control else expire_after
-        skip_write = check_expiration == DO_NOT_CACHE or 'no-store' in directives
+        check_expiration = max_age if cache_control else expire_after
+        skip_write = check_expiration == DO_NOT_CACHE or bool(flags & _NO_STORE)
 
         # These behaviors may be set by either request headers or keyword arguments
-        only_if_cached = only_if_cached or 'only-if-cached' in directives
-        revalidate = revalidate or 'no-cache' in directives
+        only_if_cached = only_if_cached or bool(flags & _ONLY_IF_CACHED)
+        revalidate = revalidate or bool(flags & _NO_CACHE)
         skip_read = skip_write or refresh or bool(refresh_temp_header)
 
         return cls(
@@ -125,11 +181,47 @@ class CacheActions:
             expire_after=expire_after,
             only_if_cached=only_if_cached,
             request_directives=directives,
+            request_flags=flags,
             revalidate=revalidate,
             skip_read=skip_read,
             skip_write=skip_write,
         )
 
+    @classmethod
+    def _from_settings(
+        cls,
+        cache_key: str,
+        session_expire_after: ExpirationTime,
+        request_expire_after: ExpirationTime,
+        only_if_cached: bool,
+        refresh: bool,
+        revalidate: bool,
+    ):
+        """Fast path for :py:meth:`from_request` for the most common case, when there are no
+        request headers or per-URL expiration to check, and only keyword arguments apply
+        """
+        expire_after = (
+            session_expire_after if request_expire_after is None else request_expire_after
+        )
+        skip_write = expire_after == DO_NOT_CACHE
+        return cls(
+            cache_key=cache_key,
+            expire_after=expire_after,
+            only_if_cached=only_if_cached,
+            revalidate=revalidate,
+            skip_read=skip_write or refresh,
+            skip_write=skip_write,
+        )
+
+    @property
+    def validation_headers(self) -> Dict[str, str]:
+        """Headers to add for a conditional request. Most requests won't need these, so the dict is
+        only created when first used.
+        """
+        if self._validation_headers is None:
+            self._validation_headers = {}
+        return self._validation_headers
+
     @property
     def expires(self) -> Optional[datetime]:
         """Convert the user/header-provided expiration value to a datetime"""
@@ -145,13 +237,13 @@ class CacheActions:
             return
 
         # Revalidation may be triggered by either stale response or request/cached response headers
-        directives = get_cache_directives(response.headers)
+        directives, flags = parse_cache_directives(response.headers)
         self.revalidate = _has_validator(response.headers) and any(
             [
                 response.is_expired,
                 self.revalidate,
-                'no-cache' in directives,
-                'must-revalidate' in directives and directives.get('max-age') == 0,
+                flags & _NO_CACHE,
+                flags & _MUST_REVALIDATE and directives.get('max-age') == 0,
             ]
         )
 
@@ -168,17 +260,17 @@ class CacheActions:
         if not response or not self.cache_control:
             return
 
-        directives = get_cache_directives(response.headers)
+        directives, flags = parse_cache_directives(response.headers)
         logger.debug(f'Cache directives from response headers: {directives}')
 
         # Check headers for expiration, validators, and other cache directives
-        if directives.get('immutable'):
+        if flags & _IMMUTABLE:
             self.expire_after = NEVER_EXPIRE
         else:
             self.expire_after = coalesce(
                 directives.get('max-age'), directives.get('expires'), self.expire_after
             )
-        no_store = 'no-store' in directives or 'no-store' in self.request_directives
+        no_store = bool((flags | self.request_flags) & _NO_STORE)
 
         # If expiration is 0 and there's a validator, save it to the cache and revalidate on use
         # Otherwise, skip writing to the cache if specified by expiration or other headers
@@ -191,20 +283,26 @@ def append_directive(
 ) -> MutableMapping[str, str]:
     """Append a Cache-Control directive to existing headers (if any)"""
     headers = CaseInsensitiveDict(headers)
-    directives = headers['Cache-Control'].split(',') if headers.get('Cache-Control') else []
-    directives.append(directive)
-    headers['Cache-Control'] = ','.join(directives)
+    cache_control = headers.get('Cache-Control')
+    headers['Cache-Control'] = f'{cache_control},{directive}' if cache_control else directive
     return headers
 
 
-def get_expiration_datetime(expire_after: ExpirationTime) -> Optional[datetime]:
-    """Convert an expiration value in any supported format to an absolute datetime"""
+def get_expiration_datetime(
+    expire_after: ExpirationTime, now: datetime = None
+) -> Optional[datetime]:
+    """Convert an expiration value in any supported format to an absolute datetime
+
+    Args:
+        expire_after: Expiration value to convert
+        now: Current time (UTC) to calculate relative expiration from, if already known
+    """
     # Never expire
     if expire_after is None or expire_after == NEVER_EXPIRE:
         return None
     # Expire immediately
     elif try_int(expire_after) == DO_NOT_CACHE:
-        return datetime.utcnow()
+        return now or datetime.utcnow()
     # Already a datetime or datetime str
     if isinstance(expire_after, str):
         return parse_http_date(expire_after)
@@ -214,30 +312,39 @@ def get_expiration_datetime(expire_after: ExpirationTime) -> Optional[datetime]:
     # Otherwise, it must be a timedelta or time in seconds
     if not isinstance(expire_after, timedelta):
         expire_after = timedelta(seconds=expire_after)
-    return datetime.utcnow() + expire_after
+    return (now or datetime.utcnow()) + expire_after
 
 
-def get_expiration_seconds(expire_after: ExpirationTime) -> int:
+def get_expiration_seconds(expire_after: ExpirationTime, now: datetime = None) -> int:
     """Convert an expiration value in any supported format to an expiration time in seconds"""
-    expires = get_expiration_datetime(expire_after)
-    return ceil((expires - datetime.utcnow()).total_seconds()) if expires else NEVER_EXPIRE
+    now = now or datetime.utcnow()
+    expires = get_expiration_datetime(expire_after, now)
+    return ceil((expires - now).total_seconds()) if expires else NEVER_EXPIRE
 
 
 def get_cache_directives(headers: MutableMapping) -> Dict[str, CacheDirective]:
     """Get all Cache-Control directives as a dict. Handle duplicate headers and comma-separated
     lists. Key-only directives are returned as ``{key: True}``.
     """
-    if not headers:
-        return {}
+    return parse_cache_directives(headers)[0]
 
-    kv_directives = {}
-    if headers.get('Cache-Control'):
-        cache_directives = headers['Cache-Control'].split(',')
-        kv_directives = dict([split_kv_directive(value) for value in cache_directives])
 
+def parse_cache_directives(headers: MutableMapping) -> Tuple[Dict[str, CacheDirective], int]:
+    """Get all Cache-Control directives as a dict (see :py:func:`get_cache_directives`), plus a
+    bitmask of key-only directives that affect cache actions.
+    """
+    if not headers or ('Cache-Control' not in headers and 'Expires' not in headers):
+        return {}, 0
+
+    kv_directives: Dict[str, CacheDirective] = {}
+    flags = 0
+    cache_control = headers.get('Cache-Control')
+    if cache_control:
+        directives, flags = _parse_cache_control(cache_control)
+        kv_directives = dict(directives)
     if 'Expires' in headers:
         kv_directives['expires'] = headers['Expires']
-    return kv_directives
+    return kv_directives, flags
 
 
 def get_504_response(request: PreparedRequest) -> Response:
@@ -252,21 +359,27 @@ def get_504_response(request: PreparedRequest) -> Response:
 
 
 def get_url_expiration(
-    url: Optional[str], urls_expire_after: ExpirationPatterns = None
+    url: Optional[str], urls_expire_after: Union[ExpirationPatterns, 'UrlPatternSet'] = None
 ) -> ExpirationTime:
     """Check for a matching per-URL expiration, if any"""
-    if not url:
+    if not url or not urls_expire_after:
         return None
-
-    for pattern, expire_after in (urls_expire_after or {}).items():
-        if url_match(url, pattern):
-            logger.debug(f'URL {url} matched pattern "{pattern}": {expire_after}')
-            return expire_after
-    return None
+    # Building and hashing this snapshot is still O(patterns) per request, but it's much cheaper
+    # than matching every pattern, and it picks up any in-place changes to urls_expire_after
+    if not isinstance(urls_expire_after, UrlPatternSet):
+        urls_expire_after = _get_url_pattern_set(tuple(urls_expire_after.items()))
+    return urls_expire_after.get_expiration(url)
 
 
+@lru_cache(maxsize=1024)
 def parse_http_date(value: str) -> Optional[datetime]:
-    """Attempt to parse an HTTP (RFC 5322-compatible) timestamp"""
+    """Attempt to parse an HTTP (RFC 5322-compatible) timestamp. Results are cached, since the same
+    ``Expires`` values are often sent with many responses.
+    """
+    # Fast path for the format used by nearly all servers; otherwise use the more lenient parser
+    dt = _parse_imf_fixdate(value)
+    if dt:
+        return dt
     try:
         expire_after = parsedate_to_datetime(value)
         return to_utc(expire_after)
@@ -275,16 +388,25 @@ def parse_http_date(value: str) -> Optional[datetime]:
         return None
 
 
-def split_kv_directive(header_value: str) -> Tuple[str, CacheDirective]:
-    """Split a cache directive into a ``(key, int)`` pair, if possible; otherwise just
-    ``(key, True)``.
+def _parse_imf_fixdate(value: str) -> Optional[datetime]:
+    """Parse an HTTP date in IMF-fixdate format, if possible, without the overhead of
+    :py:func:`~email.utils.parsedate_to_datetime`
     """
-    header_value = header_value.strip()
-    if '=' in header_value:
-        k, v = header_value.split('=', 1)
-        return k, try_int(v)
-    else:
-        return header_value, True
+    match = _IMF_FIXDATE.match(value) if isinstance(value, str) else None
+    month = _MONTHS.get(match['month'].lower()) if match else None
+    if not month:
+        return None
+    try:
+        return datetime(
+            int(match['year']),  # type: ignore
+            month,
+            int(match['day']),  # type: ignore
+            int(match['hour']),  # type: ignore
+            int(match['minute']),  # type: ignore
+            int(match['second']),  # type: ignore
+        )
+    except ValueError:
+        return None
 
 
 def to_utc(dt: datetime):
@@ -299,6 +421,11 @@ def to_utc(dt: datetime):
 
 def try_int(value: Any) -> Optional[int]:
     """Convert a value to an int, if possible, otherwise ``None``"""
+    # Skip raising and catching a ValueError for the common case of a non-numeric string
+    if isinstance(value, str):
+        value = value.strip()
+        if not value.lstrip('+-').isdigit():
+            return None
     try:
         return int(value)
     except (TypeError, ValueError):
@@ -320,10 +447,148 @@ def url_match(url: str, pattern: str) -> bool:
         >>> url_match('https://httpbin.org/stream/2', 'httpbin.org/*/1')
         False
     """
-    url = url.split('://')[-1]
-    pattern = pattern.split('://')[-1].rstrip('*') + '**'
-    return fnmatch(url, pattern)
+    return _compile_pattern(pattern).match(_strip_protocol(url)) is not None
+
+
+@lru_cache(maxsize=1024)
+def _compile_pattern(pattern: str) -> re.Pattern:
+    """Convert a URL glob pattern to a compiled regex. Patterns are cached, since the same
+    patterns are matched against every request.
+    """
+    return re.compile(_translate_pattern(pattern))
+
+
+def _translate_pattern(pattern: str) -> str:
+    """Convert a URL glob pattern to a regex string"""
+    return translate(_strip_protocol(pattern).rstrip('*') + '**')
+
+
+class UrlPatternSet:
+    """A collection of URL glob patterns, indexed by host so that a URL only needs to be matched
+    against patterns that could apply to it. Used to look up per-URL expiration values.
+
+    * Patterns with a literal host (``site.com/path``) are looked up by exact host
+    * Patterns with a wildcard subdomain (``*.site.com/path``) are looked up by host suffix
+    * Any other patterns (``*``, ``site.*/path``, etc.) are combined into a single regex, which is
+      checked for every URL
+
+    If multiple patterns match, the first one (in the order they were defined) is used.
+
+    Args:
+        urls_expire_after: Expiration times to apply for different URL patterns
+    """
+
+    def __init__(self, urls_expire_after: ExpirationPatterns = None):
+        self.urls_expire_after = urls_expire_after or {}
+        self._hosts: Dict[str, List[PatternRule]] = {}
+        self._suffixes: Dict[str, List[PatternRule]] = {}
+        self._residual: List[PatternRule] = []
+
+        for rank, (pattern, expire_after) in enumerate(self.urls_expire_after.items()):
+            rule = (rank, pattern, _compile_pattern(pattern), expire_after)
+            host = _strip_protocol(pattern).partition('/')[0]
+            if not _has_wildcard(host):
+                self._hosts.setdefault(host, []).append(rule)
+            elif host.startswith('*.') and not _has_wildcard(host[2:]):
+                self._suffixes.setdefault(host[2:], []).append(rule)
+            else:
+                self._residual.append(rule)
+
+        # Regex alternatives are tried in order, so the first match is also the first pattern defined
+        self._residual_regex = None
+        if self._residual:
+            self._residual_regex = re.compile(
+                '|'.join(
+                    f'(?P<p{i}>{_translate_pattern(rule[1])})'
+                    for i, rule in enumerate(self._residual)
+                )
+            )
+
+    def get_expiration(self, url: str) -> ExpirationTime:
+        """Get the expiration value for the first pattern that matches the given URL, if any"""
+        base_url = _strip_protocol(url)
+        host = _get_host(url)
+        hostname = _strip_port(host)
+
+        match = None
+        if self._residual_regex:
+            residual_match = self._residual_regex.match(base_url)
+            if residual_match:
+                match = self._residual[int(residual_match.lastgroup[1:])]  # type: ignore
+
+        candidates = list(self._hosts.get(host, []))
+        if hostname != host:
+            candidates.extend(self._hosts.get(hostname, []))
+        # Walk parent domains: a.b.c -> b.c -> c
+        idx = hostname.find('.')
+        while idx != -1:
+            candidates.extend(self._suffixes.get(hostname[idx + 1 :], []))
+            idx = hostname.find('.', idx + 1)
+
+        for rule in sorted(candidates, key=lambda rule: rule[0]):
+            if match and rule[0] > match[0]:
+                break
+            if rule[2].match(base_url):
+                match = rule
+                break
+
+        if not match:
+            return None
+        _, pattern, _, expire_after = match
+        logger.debug(f'URL {url} matched pattern "{pattern}": {expire_after}')
+        return expire_after
+
+    def __bool__(self):
+        return bool(self.urls_expire_after)
+
+    def __repr__(self):
+        return repr(self.urls_expire_after)
+
+
+@lru_cache(maxsize=32)
+def _get_url_pattern_set(items: Tuple[Tuple[str, ExpirationTime], ...]) -> UrlPatternSet:
+    """Get a UrlPatternSet for a snapshot of ``urls_expire_after`` items. Results are cached, so
+    patterns are only indexed again if they have changed.
+    """
+    return UrlPatternSet(dict(items))
+
+
+@lru_cache(maxsize=1024)
+def _parse_cache_control(value: str) -> Tuple[Tuple[Tuple[str, CacheDirective], ...], int]:
+    """Split a Cache-Control header value into ``(key, value)`` pairs and a bitmask of key-only
+    directives. Results are cached, since most servers send the same few values for every response.
+    """
+    directives = []
+    flags = 0
+    for directive in value.split(','):
+        key, sep, arg = directive.partition('=')
+        key = intern(key.strip())
+        directives.append((key, try_int(arg) if sep else True))
+        flags |= _DIRECTIVE_FLAGS.get(key, 0)
+    return tuple(directives), flags
 
 
 def _has_validator(headers: MutableMapping) -> bool:
     return bool(headers.get('ETag') or headers.get('Last-Modified'))
+
+
+def _has_wildcard(value: str) -> bool:
+    return any(char in value for char in '*?[')
+
+
+def _get_host(url: str) -> str:
+    """Get the host (including port, if any) from a URL, with or without a protocol"""
+    if '://' in url:
+        return urlsplit(url).netloc
+    return _HOST_DELIMITERS.split(url, 1)[0]
+
+
+def _strip_protocol(url: str) -> str:
+    """Get a base URL without the protocol (if any)"""
+    return url.rpartition('://')[2]
+
+
+def _strip_port(host: str) -> str:
+    """Remove a port number (if any) from a URL host"""
+    hostname, sep, port = host.rpartition(':')
+    return hostname if sep and port.isdigit() else host
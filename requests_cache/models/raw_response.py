@@ -1,6 +1,6 @@
 from io import BytesIO
 from logging import getLogger
-from typing import Mapping
+from typing import Mapping, Optional
 
 from attr import define, field, fields_dict
 from requests import Response
@@ -23,8 +23,6 @@ class CachedHTTPResponse(HTTPResponse):
     """
 
     decode_content: bool = field(default=None)
-    # These headers are redundant and not serialized; copied in init and CachedResponse post-init
-    headers: HTTPHeaderDict = None  # type: ignore
     reason: str = field(default=None)
     request_url: str = field(default=None)
     status: int = field(default=0)
@@ -37,9 +35,39 @@ class CachedHTTPResponse(HTTPResponse):
         super().__init__(body=BytesIO(body or b''), preload_content=False, **kwargs)
 
         self._body = body
-        self.headers = HTTPHeaderDict(headers)
+        self._headers = None
+        self._lazy_headers = headers
         self.__attrs_init__(*args, **kwargs)  # type: ignore # False positive in mypy 0.920+?
 
+    # These headers are redundant and not serialized; copied in init and CachedResponse post-init.
+    # Since they're rarely used, they're only converted to a HTTPHeaderDict when first accessed.
+    _headers: Optional[HTTPHeaderDict] = None
+    _lazy_headers: Optional[Mapping] = None
+
+    @property
+    def headers(self) -> HTTPHeaderDict:  # type: ignore
+        if self._headers is None:
+            self._headers = HTTPHeaderDict(self._lazy_headers)
+            self._lazy_headers = None
+        return self._headers
+
+    @headers.setter
+    def headers(self, value: HTTPHeaderDict):
+        self._headers = value
+
+    def __setstate__(self, state):
+        """Handle responses pickled before headers were converted lazily, which stored them under
+        ``headers`` instead of ``_headers``
+        """
+        if 'headers' in state:
+            state['_headers'] = state.pop('headers')
+        self.__dict__.update(state)
+
+    def _has_header(self, name: str) -> bool:
+        """Check for a header without converting lazy headers to a HTTPHeaderDict"""
+        headers = self._headers if self._headers is not None else self._lazy_headers or {}
+        return any(k.lower() == name for k in headers)
+
     @classmethod
     def from_response(cls, original_response: Response):
         """Create a CachedHTTPResponse based on an original response"""
@@ -72,7 +100,7 @@ class CachedHTTPResponse(HTTPResponse):
         """Simplified reader for cached content that emulates
         :py:meth:`urllib3.response.HTTPResponse.read()`
         """
-        if 'content-encoding' in self.headers and decode_content is False:
+        if decode_content is False and self._has_header('content-encoding'):
             logger.warning('read() returns decoded data, even with decode_content=False')
 
         data = self._fp.read(amt)
@@ -1,23 +1,25 @@
 from datetime import datetime, timedelta, timezone
 from logging import getLogger
-from typing import TYPE_CHECKING, List, Optional, Tuple, Union
+from math import inf
+from time import time
+from typing import List, Optional, Tuple, Union
 
 import attr
 from attr import define, field
 from requests import PreparedRequest, Response
 from requests.cookies import RequestsCookieJar
 from requests.structures import CaseInsensitiveDict
-from urllib3._collections import HTTPHeaderDict
 
 from ..cache_control import ExpirationTime, get_expiration_datetime
 from . import CachedHTTPResponse, CachedRequest
 
 DATETIME_FORMAT = '%Y-%m-%d %H:%M:%S %Z'  # Format used for __str__ only
+FILE_SIZE_UNITS = ('bytes', 'KiB', 'MiB', 'GiB')
 HeaderList = List[Tuple[str, str]]
 logger = getLogger(__name__)
 
 
-@define(auto_attribs=False, slots=False)
+@define(auto_attribs=False, slots=True)
 class CachedResponse(Response):
     """A class that emulates :py:class:`requests.Response`, with some additional optimizations
     for serialization.
@@ -25,12 +27,15 @@ class CachedResponse(Response):
 
     _content: bytes = field(default=None)
     _next: Optional[CachedRequest] = field(default=None)
-    cache_key: Optional[str] = None  # Not serialized; set by BaseCache.get_response()
+    # Not serialized; set by BaseCache.get_response()
+    cache_key: Optional[str] = field(default=None, init=False, repr=False, eq=False)
     cookies: RequestsCookieJar = field(factory=RequestsCookieJar)
     created_at: datetime = field(factory=datetime.utcnow)
     elapsed: timedelta = field(factory=timedelta)
     encoding: str = field(default=None)
-    expires: Optional[datetime] = field(default=None)
+    expires: Optional[datetime] = field(
+        default=None, on_setattr=lambda self, _, v: self._set_expires_ts(v)
+    )
     headers: CaseInsensitiveDict = field(factory=CaseInsensitiveDict)
     history: List['CachedResponse'] = field(factory=list)  # type: ignore
     raw: CachedHTTPResponse = field(factory=CachedHTTPResponse, repr=False)
@@ -39,28 +44,55 @@ class CachedResponse(Response):
     status_code: int = field(default=0)
     url: str = field(default=None)
 
+    # Derived from expires, and not serialized. Declared as a field so it's stored in a slot.
+    _expires_ts: float = field(default=inf, init=False, repr=False, eq=False)
+
     def __attrs_post_init__(self):
         """Re-initialize raw response body after deserialization"""
         if self.raw._body is None and self._content is not None:
             self.raw.reset(self._content)
-        if not self.raw.headers:
-            self.raw.headers = HTTPHeaderDict(self.headers)
+        if self.raw._headers is None and not self.raw._lazy_headers:
+            self.raw._lazy_headers = self.headers
+        self._set_expires_ts(self.expires)
 
     @classmethod
     def from_response(
         cls,
         original_response: Union[Response, 'CachedResponse'],
         expires: datetime = None,
+        copy_history: bool = True,
         **kwargs,
     ):
-        """Create a CachedResponse based on an original Response or another CachedResponse object"""
+        """Create a CachedResponse based on an original Response or another CachedResponse object
+
+        Args:
+            original_response: Response to copy
+            expires: Absolute expiration time for the new response
+            copy_history: Also copy redirect history. Set to ``False`` if only the final response
+                is needed, to skip creating a new ``CachedResponse`` for each redirect.
+        """
         if isinstance(original_response, CachedResponse):
-            return attr.evolve(original_response, expires=expires)
+            obj = attr.evolve(original_response, expires=expires)
+            # If a redirect ended in a cached response, requests will have set its history to the
+            # original (non-cached) redirect responses
+            if copy_history:
+                obj.history = [
+                    r if isinstance(r, CachedResponse) else cls.from_response(r, copy_history=False)
+                    for r in obj.history
+                ]
+            else:
+                obj.history = []
+            return obj
         obj = cls(expires=expires, **kwargs)
 
-        # Copy basic attributes
-        for k in Response.__attrs__:
-            setattr(obj, k, getattr(original_response, k, None))
+        # Copy basic attributes (the rest of Response.__attrs__ are converted below)
+        obj.cookies = original_response.cookies
+        obj.elapsed = original_response.elapsed
+        obj.encoding = original_response.encoding
+        obj.headers = original_response.headers
+        obj.reason = original_response.reason
+        obj.status_code = original_response.status_code
+        obj.url = original_response.url
 
         # Store request, raw response, and next response (if it's a redirect response)
         obj.request = CachedRequest.from_request(original_response.request)
@@ -74,9 +106,9 @@ class CachedResponse(Response):
 
         # Copy redirect history, if any; avoid recursion by not copying redirects of redirects
         obj.history = []
-        if not obj.is_redirect:
+        if copy_history and not obj.is_redirect:
             for redirect in original_response.history:
-                obj.history.append(cls.from_response(redirect))
+                obj.history.append(cls.from_response(redirect, copy_history=False))
 
         return obj
 
@@ -96,15 +128,24 @@ class CachedResponse(Response):
     @property
     def is_expired(self) -> bool:
         """Determine if this cached response is expired"""
-        return self.expires is not None and datetime.utcnow() >= self.expires
+        return time() >= self._expires_ts
+
+    def _set_expires_ts(self, expires: Optional[datetime]) -> Optional[datetime]:
+        """Keep a POSIX timestamp alongside ``expires``, so expiration checks only need to compare
+        floats. This is derived from ``expires`` and not serialized.
+        """
+        self._expires_ts = expires.replace(tzinfo=timezone.utc).timestamp() if expires else inf
+        return expires
 
     @property
     def ttl(self) -> Optional[int]:
         """Get time to expiration in seconds"""
-        if self.expires is None or self.is_expired:
+        if self.expires is None:
+            return None
+        now = datetime.utcnow()
+        if now >= self.expires:
             return None
-        delta = self.expires - datetime.utcnow()
-        return int(delta.total_seconds())
+        return int((self.expires - now).total_seconds())
 
     @property
     def next(self) -> Optional[PreparedRequest]:
@@ -113,8 +154,9 @@ class CachedResponse(Response):
 
     def reset_expiration(self, expire_after: ExpirationTime) -> bool:
         """Set a new expiration for this response, and determine if it is now expired"""
-        self.expires = get_expiration_datetime(expire_after)
-        return self.is_expired
+        now = datetime.utcnow()
+        self.expires = get_expiration_datetime(expire_after, now)
+        return self.expires is not None and now >= self.expires
 
     @property
     def size(self) -> int:
@@ -122,11 +164,23 @@ class CachedResponse(Response):
         return len(self.content) if self.content else 0
 
     def __getstate__(self):
-        """Override pickling behavior from ``requests.Response.__getstate__``"""
-        return self.__dict__
+        """Override pickling behavior from ``requests.Response.__getstate__``. Attributes are stored
+        in slots instead of ``__dict__``, so they need to be gathered from attrs fields. Other fields
+        that aren't init arguments are derived at runtime, and are skipped.
+        """
+        return {
+            f.name: getattr(self, f.name)
+            for f in attr.fields(self.__class__)
+            if f.init or f.name == 'cache_key'
+        }
 
     def __setstate__(self, state):
-        """Override pickling behavior from ``requests.Response.__setstate__``"""
+        """Override pickling behavior from ``requests.Response.__setstate__``. Fields that aren't
+        init arguments are set to their defaults first, so their slots are never left empty.
+        """
+        for f in attr.fields(self.__class__):
+            if not f.init:
+                object.__setattr__(self, f.name, f.default)
         for name, value in state.items():
             setattr(self, name, value)
 
@@ -149,18 +203,12 @@ def format_datetime(value: Optional[datetime]) -> str:
 
 def format_file_size(n_bytes: int) -> str:
     """Convert a file size in bytes into a human-readable format"""
-    filesize = float(n_bytes or 0)
-
-    def _format(unit):
-        return f'{int(filesize)} {unit}' if unit == 'bytes' else f'{filesize:.2f} {unit}'
-
-    for unit in ['bytes', 'KiB', 'MiB', 'GiB']:
-        if filesize < 1024 or unit == 'GiB':
-            return _format(unit)
-        filesize /= 1024
-
-    if TYPE_CHECKING:
-        return _format(unit)
+    n_bytes = int(n_bytes or 0)
+    # Each unit is 2^10 times the previous one, so the unit index can be read from the bit length
+    unit_idx = min(len(FILE_SIZE_UNITS) - 1, max(0, (n_bytes.bit_length() - 1) // 10))
+    if unit_idx == 0:
+        return f'{n_bytes} bytes'
+    return f'{n_bytes / (1 << (10 * unit_idx)):.2f} {FILE_SIZE_UNITS[unit_idx]}'
 
 
 def set_response_defaults(
@@ -12,9 +12,11 @@ serialization format.
    :nosignatures:
 """
 from datetime import datetime, timedelta
-from typing import Callable, Dict, ForwardRef, MutableMapping
+from typing import Callable, Dict, MutableMapping
 
+from attr import fields, resolve_types
 from cattr import GenConverter
+from cattr.gen import make_dict_unstructure_fn, override
 from requests.cookies import RequestsCookieJar, cookiejar_from_dict
 from requests.structures import CaseInsensitiveDict
 from urllib3._collections import HTTPHeaderDict
@@ -65,10 +67,18 @@ def init_converter(factory: Callable[..., GenConverter] = None):
     converter.register_unstructure_hook(HTTPHeaderDict, dict)
     converter.register_structure_hook(HTTPHeaderDict, lambda obj, cls: HTTPHeaderDict(obj))
 
-    # Tell cattrs to resolve forward references (required for CachedResponse.history)
-    converter.register_structure_hook_func(
-        lambda cls: cls.__class__ is ForwardRef,
-        lambda obj, cls: converter.structure(obj, cls.__forward_value__),
+    # Resolve forward references, so cattrs can (un)structure CachedResponse.history
+    resolve_types(CachedResponse)
+
+    # Skip fields that are only used at runtime (not init arguments)
+    converter.register_unstructure_hook(
+        CachedResponse,
+        make_dict_unstructure_fn(
+            CachedResponse,
+            converter,
+            True,  # omit_if_default
+            **{f.name: override(omit=True) for f in fields(CachedResponse) if not f.init},
+        ),
     )
 
     return converter
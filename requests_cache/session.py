@@ -16,7 +16,7 @@
 from contextlib import contextmanager
 from logging import getLogger
 from threading import RLock
-from typing import TYPE_CHECKING, Callable, Dict, Iterable, MutableMapping, Optional
+from typing import TYPE_CHECKING, Callable, Iterable, MutableMapping, Optional
 
 from requests import PreparedRequest, Response
 from requests import Session as OriginalSession
@@ -27,6 +27,7 @@ from ._utils import get_valid_kwargs
 from .backends import BackendSpecifier, init_backend
 from .cache_control import (
     CacheActions,
+    ExpirationPatterns,
     ExpirationTime,
     append_directive,
     get_504_response,
@@ -55,7 +56,7 @@ class CacheMixin(MIXIN_BASE):
         cache_name: str = 'http_cache',
         backend: BackendSpecifier = None,
         expire_after: ExpirationTime = -1,
-        urls_expire_after: Dict[str, ExpirationTime] = None,
+        urls_expire_after: ExpirationPatterns = None,
         cache_control: bool = False,
         allowable_codes: Iterable[int] = (200,),
         allowable_methods: Iterable[str] = ('GET', 'HEAD'),
@@ -122,12 +123,15 @@ class CacheMixin(MIXIN_BASE):
         """
         # Set extra options as headers to be handled in send(), since we can't pass args directly
         headers = headers or {}
+        directives = []
         if expire_after is not None:
-            headers = append_directive(headers, f'max-age={get_expiration_seconds(expire_after)}')
+            directives.append(f'max-age={get_expiration_seconds(expire_after)}')
         if only_if_cached:
-            headers = append_directive(headers, 'only-if-cached')
+            directives.append('only-if-cached')
         if revalidate:
-            headers = append_directive(headers, 'no-cache')
+            directives.append('no-cache')
+        if directives:
+            headers = append_directive(headers, ','.join(directives))
         if refresh:
             headers['requests-cache-refresh'] = 'true'
         kwargs['headers'] = headers
@@ -278,14 +282,15 @@ class CacheMixin(MIXIN_BASE):
     def _update_revalidated_response(
         self, actions: CacheActions, response: Response, cached_response: CachedResponse
     ) -> CachedResponse:
-        """After revalidation, update the cached response's headers and reset its expiration"""
+        """After revalidation, update the cached response's headers and reset its expiration.
+        This response came from the cache, so it can be updated in place instead of copied.
+        """
         logger.debug(
             f'Response for URL {response.request.url} has not been modified; updating and using cached response'
         )
         cached_response.headers.update(response.headers)
         actions.update_from_response(cached_response)
-        cached_response.expires = actions.expires
-        self.cache.save_response(cached_response, actions.cache_key, actions.expires)
+        self.cache.save_response(cached_response, actions.cache_key, actions.expires, copy=False)
         return cached_response
 
     @contextmanager
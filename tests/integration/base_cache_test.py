@@ -6,18 +6,23 @@ from functools import partial
 from io import BytesIO
 from logging import getLogger
 from random import randint
-from time import sleep, time
+from time import time
 from typing import Dict, Type
 from unittest.mock import MagicMock, patch
-from urllib.parse import parse_qs, urlparse
+from urllib.parse import parse_qs, parse_qsl, urlsplit
 
 import pytest
-import requests
-from requests import PreparedRequest, Session
+from requests import PreparedRequest, Request, Session
 
 from requests_cache import ALL_METHODS, CachedResponse, CachedSession
 from requests_cache.backends.base import BaseCache
-from requests_cache.serializers import SERIALIZERS, SerializerPipeline, safe_pickle_serializer
+from requests_cache.serializers import (
+    SERIALIZERS,
+    SerializerPipeline,
+    Stage,
+    safe_pickle_serializer,
+)
+from requests_cache.serializers.preconf import msgpack_preconf_stage
 from tests.conftest import (
     CACHE_NAME,
     ETAG,
@@ -36,12 +41,38 @@ from tests.conftest import (
 
 logger = getLogger(__name__)
 
-# Handle optional dependencies if they're not installed; if so, skips will be shown in pytest output
-TEST_SERIALIZERS = SERIALIZERS.copy()
+# Handle optional dependencies if they're not installed. Any serializers with missing dependencies
+# are excluded from TEST_SERIALIZERS, and are marked as skipped in SERIALIZER_PARAMS.
+_serializers = SERIALIZERS.copy()
+try:
+    _serializers['safe_pickle'] = safe_pickle_serializer(secret_key='hunter2')
+except ImportError:
+    _serializers['safe_pickle'] = 'safe_pickle_placeholder'
 try:
-    TEST_SERIALIZERS['safe_pickle'] = safe_pickle_serializer(secret_key='hunter2')
+    import msgpack
+
+    _serializers['msgpack'] = SerializerPipeline(
+        [
+            msgpack_preconf_stage,
+            Stage(
+                dumps=partial(msgpack.packb, use_bin_type=True),
+                loads=partial(msgpack.unpackb, raw=False),
+            ),
+        ],
+        is_binary=True,
+    )
 except ImportError:
-    TEST_SERIALIZERS['safe_pickle'] = 'safe_pickle_placeholder'
+    _serializers['msgpack'] = 'msgpack_placeholder'
+TEST_SERIALIZERS = {k: v for k, v in _serializers.items() if isinstance(v, SerializerPipeline)}
+SERIALIZER_PARAMS = [
+    pytest.param(v, id=k)
+    if k in TEST_SERIALIZERS
+    else pytest.param(v, id=k, marks=pytest.mark.skip(reason=f'Dependencies not installed for {k}'))
+    for k, v in _serializers.items()
+]
+
+# Non-cached session for any requests that need to bypass the cache, reused to keep connections open
+UNCACHED_SESSION = Session()
 VALIDATOR_HEADERS = [{'ETag': ETAG}, {'Last-Modified': LAST_MODIFIED}]
 
 
@@ -64,29 +95,32 @@ class BaseCacheTest:
     def teardown_class(cls):
         cls().init_session(clear=True)
 
-    @pytest.mark.parametrize('serializer', TEST_SERIALIZERS.values())
+    @pytest.fixture(scope='class')
+    def serializer_session(self, request) -> CachedSession:
+        """Get a session for an (indirectly parametrized) serializer, shared by all tests in a class
+        that use the same serializer
+        """
+        return self.init_session(serializer=request.param)
+
+    @pytest.mark.parametrize('serializer_session', SERIALIZER_PARAMS, indirect=True)
     @pytest.mark.parametrize('method', HTTPBIN_METHODS)
     @pytest.mark.parametrize('field', ['params', 'data', 'json'])
-    def test_all_methods(self, field, method, serializer):
+    def test_all_methods(self, field, method, serializer_session):
         """Test all relevant combinations of methods X data fields X serializers.
         Requests with different request params, data, or json should be cached under different keys.
         """
-        if not isinstance(serializer, SerializerPipeline):
-            pytest.skip(f'Dependencies not installed for {serializer}')
-
         url = httpbin(method.lower())
-        session = self.init_session(serializer=serializer)
+        session = serializer_session
+        session.cache.clear()
         for params in [{'param_1': 1}, {'param_1': 2}, {'param_2': 2}]:
-            assert session.request(method, url, **{field: params}).from_cache is False
-            assert session.request(method, url, **{field: params}).from_cache is True
+            request = session.prepare_request(Request(method, url, **{field: params}))
+            assert session.send(request).from_cache is False
+            assert session.send(request).from_cache is True
 
-    @pytest.mark.parametrize('serializer', TEST_SERIALIZERS.values())
+    @pytest.mark.parametrize('serializer', SERIALIZER_PARAMS)
     @pytest.mark.parametrize('response_format', HTTPBIN_FORMATS)
     def test_all_response_formats(self, response_format, serializer):
         """Test that all relevant combinations of response formats X serializers are cached correctly"""
-        if not isinstance(serializer, SerializerPipeline):
-            pytest.skip(f'Dependencies not installed for {serializer}')
-
         session = self.init_session(serializer=serializer)
         # Workaround for this issue: https://github.com/kevin1024/pytest-httpbin/issues/60
         if response_format == 'json' and USE_PYTEST_HTTPBIN:
@@ -101,17 +135,26 @@ class BaseCacheTest:
     def test_response_no_duplicate_read(self):
         """Ensure that response data is read only once per request, whether it's cached or not"""
         session = self.init_session()
-        storage_class = type(session.cache.responses)
+        responses = session.cache.responses
+        storage_class = type(responses)
 
-        # Patch storage class to track number of times getitem is called, without changing behavior
-        with patch.object(
-            storage_class, '__getitem__', side_effect=storage_class.__getitem__
-        ) as getitem:
+        # Patch storage class to track number of times getitem is called, without changing behavior.
+        # This uses a plain function instead of a MagicMock, to avoid its call-tracking overhead.
+        original_getitem = storage_class.__getitem__
+        getitem_keys = []
+
+        def getitem(self, key):
+            # Storage class may also be used for redirects, which aren't counted here
+            if self is responses:
+                getitem_keys.append(key)
+            return original_getitem(self, key)
+
+        with patch.object(storage_class, '__getitem__', getitem):
             session.get(httpbin('get'))
-            assert getitem.call_count == 1
+            assert len(getitem_keys) == 1
 
             session.get(httpbin('get'))
-            assert getitem.call_count == 2
+            assert len(getitem_keys) == 2
 
     @pytest.mark.parametrize('n_redirects', range(1, 5))
     @pytest.mark.parametrize('endpoint', ['redirect', 'absolute-redirect', 'relative-redirect'])
@@ -142,18 +185,20 @@ class BaseCacheTest:
         session = self.init_session()
 
         def get_json(url):
-            return json.loads(session.get(url).text)
+            return json.loads(session.get(url).content)
+
+        def get_json_uncached(url):
+            with session.cache_disabled():
+                return get_json(url)
 
         response_1 = get_json(httpbin('cookies/set/test1/test2'))
-        with session.cache_disabled():
-            assert get_json(httpbin('cookies')) == response_1
+        assert get_json_uncached(httpbin('cookies')) == response_1
         # From cache
         response_2 = get_json(httpbin('cookies'))
         assert response_2 == get_json(httpbin('cookies'))
         # Not from cache
-        with session.cache_disabled():
-            response_3 = get_json(httpbin('cookies/set/test3/test4'))
-            assert response_3 == get_json(httpbin('cookies'))
+        response_3 = get_json_uncached(httpbin('cookies/set/test3/test4'))
+        assert response_3 == get_json_uncached(httpbin('cookies'))
 
     @pytest.mark.parametrize(
         'cache_control, request_headers, expected_expiration',
@@ -198,7 +243,7 @@ class BaseCacheTest:
         be added. The `/cache` endpoint returns a 304 if one of these request headers is present.
         When this happens, the previously cached response should be returned.
         """
-        response = requests.get(httpbin('cache'))
+        response = UNCACHED_SESSION.get(httpbin('cache'))
         response.headers = cached_response_headers
 
         session = self.init_session(cache_control=True)
@@ -274,34 +319,40 @@ class BaseCacheTest:
         """
         session = self.init_session()
         response = session.get(httpbin('gzip'), stream=stream)
-        assert b'gzipped' in response.content
+        content = response.content
+        assert b'gzipped' in content
         if stream is True:
-            assert b'gzipped' in response.raw.read(None, decode_content=True)
-        response.raw._fp = BytesIO(response.content)
+            assert response.raw.read(None, decode_content=True) == content
 
+        # The raw response's body has already been decoded at this point, so no further gzip
+        # decoding is needed to create and read from a CachedResponse
+        response.raw._fp = BytesIO(content)
         cached_response = CachedResponse.from_response(response)
-        assert b'gzipped' in cached_response.content
-        assert b'gzipped' in cached_response.raw.read(None, decode_content=True)
+        assert cached_response.content == content
+        assert cached_response.raw.read(None, decode_content=True) == content
 
     def test_multipart_upload(self):
         session = self.init_session()
-        session.post(httpbin('post'), files={'file1': BytesIO(b'10' * 1024)})
+        files = {'file1': b'10' * 1024}
+        session.post(httpbin('post'), files=files)
         for i in range(5):
-            assert session.post(httpbin('post'), files={'file1': BytesIO(b'10' * 1024)}).from_cache
+            assert session.post(httpbin('post'), files=files).from_cache
 
     def test_remove_expired_responses(self):
         session = self.init_session(expire_after=1)
 
         # Populate the cache with several responses that should expire immediately
-        for response_format in HTTPBIN_FORMATS:
-            session.get(httpbin(response_format))
-        session.get(httpbin('redirect/1'))
-        sleep(1)
-
-        # Cache a response + redirects, which should be the only non-expired cache items
-        session.get(httpbin('get'), expire_after=-1)
-        session.get(httpbin('redirect/3'), expire_after=-1)
-        session.cache.remove_expired_responses()
+        urls = [httpbin(response_format) for response_format in HTTPBIN_FORMATS]
+        urls.append(httpbin('redirect/1'))
+        with ThreadPoolExecutor(max_workers=len(urls)) as executor:
+            _ = list(executor.map(session.get, urls))
+
+        # Advance the clock used for expiration checks, instead of waiting for those to expire
+        with patch('requests_cache.models.response.time', side_effect=lambda: time() + 2):
+            # Cache a response + redirects, which should be the only non-expired cache items
+            session.get(httpbin('get'), expire_after=-1)
+            session.get(httpbin('redirect/3'), expire_after=-1)
+            session.cache.remove_expired_responses()
 
         assert len(session.cache.responses.keys()) == 2
         assert len(session.cache.redirects.keys()) == 3
@@ -326,9 +377,8 @@ class BaseCacheTest:
         assert response.from_cache is False
         response = session.request(method, url, params={"api_key": "<Secret Key>"})
         assert response.from_cache is True
-        query = urlparse(response.request.url).query
-        query_dict = parse_qs(query)
-        assert 'api_key' not in query_dict
+        query = urlsplit(response.request.url).query
+        assert not any(k == 'api_key' for k, _ in parse_qsl(query))
 
     @pytest.mark.parametrize('post_type', ['data', 'json'])
     def test_filter_request_post_data(self, post_type):
@@ -347,39 +397,60 @@ class BaseCacheTest:
             assert "api_key" not in body
 
     @pytest.mark.parametrize('executor_class', [ThreadPoolExecutor, ProcessPoolExecutor])
-    @pytest.mark.parametrize('iteration', range(N_ITERATIONS))
-    def test_concurrency(self, iteration, executor_class):
+    def test_concurrency(self, executor_class):
         """Run multithreaded and multiprocess stress tests for each backend.
         The number of workers (thread/processes), iterations, and requests per iteration can be
         increased via the `STRESS_TEST_MULTIPLIER` environment variable.
         """
         start = time()
         url = httpbin('anything')
-        self.init_session(clear=True)
+        session = self.init_session(clear=True)
 
-        session_factory = partial(self.init_session, clear=False)
-        request_func = partial(_send_request, session_factory, url)
-        with ProcessPoolExecutor(max_workers=N_WORKERS) as executor:
-            _ = list(executor.map(request_func, range(N_REQUESTS_PER_ITERATION)))
+        # Threads can all share the same session; processes each create their own session once
+        if executor_class is ThreadPoolExecutor:
+            request_func = partial(_send_request, url, session=session)
+            executor_kwargs = {}
+        else:
+            request_func = partial(_send_request, url)
+            session_factory = partial(self.init_session, clear=False)
+            executor_kwargs = {'initializer': _init_worker, 'initargs': (session_factory,)}
+
+        # Use the same workers for all iterations, and clear the cache before each iteration. Note
+        # that with an in-memory backend, worker processes keep their own caches across iterations.
+        with executor_class(max_workers=N_WORKERS, **executor_kwargs) as executor:
+            for _ in range(N_ITERATIONS):
+                session.cache.clear()
+                list(executor.map(request_func, range(N_REQUESTS_PER_ITERATION)))
 
         # Some logging for debug purposes
         elapsed = time() - start
-        average = (elapsed * 1000) / (N_ITERATIONS * N_WORKERS)
+        n_requests = N_ITERATIONS * N_REQUESTS_PER_ITERATION
+        average = (elapsed * 1000) / n_requests
         worker_type = 'threads' if executor_class is ThreadPoolExecutor else 'processes'
         logger.info(
-            f'{self.backend_class.__name__}: Ran {N_REQUESTS_PER_ITERATION} requests with '
+            f'{self.backend_class.__name__}: Ran {n_requests} requests with '
             f'{N_WORKERS} {worker_type} in {elapsed} s\n'
             f'Average time per request: {average} ms'
         )
 
 
-def _send_request(session_factory, url, _=None):
+# Session used by _send_request(); created once per worker process by _init_worker()
+_worker_session: CachedSession = None
+
+
+def _init_worker(session_factory):
+    """Worker initializer for stress tests, so each worker only needs to create one session"""
+    global _worker_session
+    _worker_session = session_factory()
+
+
+def _send_request(url, _=None, session: CachedSession = None):
     """Concurrent request function for stress tests. Defined in module scope so it can be serialized
-    to multiple processes.
+    to multiple processes. If a session isn't provided, the worker's session is used.
     """
     # Use fewer unique requests/cached responses than total iterations, so we get some cache hits
     n_unique_responses = int(N_REQUESTS_PER_ITERATION / 4)
     i = randint(1, n_unique_responses)
 
-    session = session_factory()
+    session = session or _worker_session
     return session.get(url, params={f'key_{i}': f'value_{i}'})
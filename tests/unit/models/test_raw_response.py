@@ -1,5 +1,7 @@
 from io import BytesIO
 
+from urllib3.response import HTTPHeaderDict
+
 from requests_cache.models import CachedHTTPResponse
 from tests.conftest import MOCKED_URL
 
@@ -57,3 +59,30 @@ def test_stream():
         data += chunk
     assert data == b'mock response'
     assert raw._fp.closed
+
+
+def test_read__decode_content_false(caplog):
+    raw = CachedHTTPResponse(body=b'mock response', headers={'Content-Encoding': 'gzip'})
+    raw.read(decode_content=False)
+    assert 'returns decoded data' in caplog.text
+    # Checking for Content-Encoding shouldn't convert lazy headers
+    assert raw._headers is None
+
+
+def test_headers__lazy():
+    raw = CachedHTTPResponse(headers={'Content-Type': 'text/plain'})
+    assert raw._headers is None
+    assert raw.headers['content-type'] == 'text/plain'
+    assert raw._lazy_headers is None
+
+
+def test_setstate__legacy_headers():
+    """Responses pickled before headers were converted lazily store them under 'headers'"""
+    raw = CachedHTTPResponse(body=b'mock response')
+    state = raw.__dict__.copy()
+    del state['_headers']
+    state['headers'] = HTTPHeaderDict({'Content-Type': 'text/plain'})
+
+    raw = CachedHTTPResponse.__new__(CachedHTTPResponse)
+    raw.__setstate__(state)
+    assert raw.headers['Content-Type'] == 'text/plain'
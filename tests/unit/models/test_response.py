@@ -1,3 +1,5 @@
+import pickle
+from copy import deepcopy
 from datetime import datetime, timedelta
 from io import BytesIO
 from time import sleep
@@ -6,6 +8,7 @@ import pytest
 from urllib3.response import HTTPResponse
 
 from requests_cache.models.response import CachedResponse, format_file_size
+from requests_cache.serializers.preconf import base_stage
 from tests.conftest import MOCKED_URL
 
 
@@ -24,6 +27,13 @@ def test_basic_attrs(mock_session):
     assert response.is_expired is False
 
 
+def test_raw_headers():
+    """Raw response headers aren't serialized, and should be copied from response headers"""
+    response = CachedResponse(headers={'Content-Type': 'text/plain'})
+    assert response.raw._headers is None
+    assert dict(response.raw.headers) == {'Content-Type': 'text/plain'}
+
+
 def test_history(mock_session):
     original_response = mock_session.get(MOCKED_URL)
     original_response.history = [mock_session.get(MOCKED_URL)] * 3
@@ -32,6 +42,33 @@ def test_history(mock_session):
     assert all([isinstance(r, CachedResponse) for r in response.history])
 
 
+def test_history__skip(mock_session):
+    original_response = mock_session.get(MOCKED_URL)
+    original_response.history = [mock_session.get(MOCKED_URL)] * 3
+    response = CachedResponse.from_response(original_response, copy_history=False)
+    assert response.history == []
+
+    # History should also be skipped when copying a CachedResponse
+    cached_response = CachedResponse.from_response(original_response)
+    response = CachedResponse.from_response(cached_response, copy_history=False)
+    assert response.history == []
+    assert len(cached_response.history) == 3
+
+
+def test_history__from_cached_response(mock_session):
+    """If a CachedResponse has non-cached redirect history (set by requests after following
+    redirects), those responses should be converted
+    """
+    mock_session.get(MOCKED_URL)
+    cached_response = mock_session.get(MOCKED_URL)
+    with mock_session.cache_disabled():
+        cached_response.history = [mock_session.get(MOCKED_URL)] * 2
+
+    response = CachedResponse.from_response(cached_response)
+    assert len(response.history) == 2
+    assert all([isinstance(r, CachedResponse) for r in response.history])
+
+
 @pytest.mark.parametrize(
     'expires, is_expired',
     [
@@ -45,6 +82,50 @@ def test_is_expired(expires, is_expired, mock_session):
     assert response.is_expired == is_expired
 
 
+def test_is_expired__set_expires(mock_session):
+    """Expiration status should be updated when expires is set directly, or after unpickling"""
+    response = CachedResponse.from_response(mock_session.get(MOCKED_URL))
+    assert response.is_expired is False
+
+    response.expires = datetime.utcnow() - timedelta(seconds=1)
+    assert response.is_expired is True
+    assert pickle.loads(pickle.dumps(response)).is_expired is True
+
+    response.expires = None
+    assert response.is_expired is False
+
+
+@pytest.mark.parametrize('attr_name', ['cache_key', '_expires_ts'])
+def test_runtime_attrs__not_serialized(mock_session, attr_name):
+    """Runtime-only attributes should be stored in slots, and not serialized"""
+    mock_session.expire_after = 60
+    mock_session.get(MOCKED_URL)
+    response = mock_session.get(MOCKED_URL)
+    assert response.cache_key is not None
+    assert response.__dict__ == {}
+    assert attr_name not in base_stage.dumps(response)
+    assert '_expires_ts' not in response.__getstate__()
+
+
+def test_runtime_attrs__copy(mock_session):
+    """Runtime-only attributes should still be set after pickling or copying"""
+    mock_session.expire_after = 60
+    mock_session.get(MOCKED_URL)
+    response = mock_session.get(MOCKED_URL)
+
+    for response_copy in [pickle.loads(pickle.dumps(response)), deepcopy(response)]:
+        assert response_copy.cache_key == response.cache_key
+        assert response_copy._expires_ts == response._expires_ts
+
+    # Responses pickled without runtime-only attributes should get their defaults
+    state = response.__getstate__()
+    del state['cache_key']
+    response_copy = CachedResponse.__new__(CachedResponse)
+    response_copy.__setstate__(state)
+    assert response_copy.cache_key is None
+    assert response_copy._expires_ts == response._expires_ts
+
+
 def test_iterator(mock_session):
     # Set up mock response with streamed content
     url = f'{MOCKED_URL}/stream'
@@ -135,9 +216,12 @@ def test_repr(mock_session):
     [
         (None, '0 bytes'),
         (5, '5 bytes'),
+        (1023, '1023 bytes'),
+        (1024, '1.00 KiB'),
         (3 * 1024, '3.00 KiB'),
         (1024 * 3000, '2.93 MiB'),
         (1024 * 1024 * 5000, '4.88 GiB'),
+        (1024**4 * 2, '2048.00 GiB'),
     ],
 )
 def test_format_file_size(n_bytes, expected_size):
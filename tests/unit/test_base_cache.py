@@ -151,3 +151,19 @@ def test_save_response_manual(mock_session):
     response = mock_session.get(MOCKED_URL)
     mock_session.cache.clear()
     mock_session.cache.save_response(response)
+
+
+def test_save_response__copy(mock_session):
+    """A CachedResponse should be copied when saved, unless copy=False"""
+    mock_session.get(MOCKED_URL)
+    response = mock_session.get(MOCKED_URL)
+    key = response.cache_key
+    expires = datetime.utcnow() + timedelta(days=1)
+
+    mock_session.cache.save_response(response, key, expires)
+    assert response.expires is None
+    assert mock_session.cache.responses[key].expires == expires
+
+    mock_session.cache.save_response(response, key, expires, copy=False)
+    assert response.expires == expires
+    assert mock_session.cache.responses[key].expires == expires
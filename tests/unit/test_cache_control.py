@@ -7,8 +7,14 @@ from requests import PreparedRequest
 from requests_cache.cache_control import (
     DO_NOT_CACHE,
     CacheActions,
+    UrlPatternSet,
+    get_cache_directives,
     get_expiration_datetime,
+    get_expiration_seconds,
     get_url_expiration,
+    parse_cache_directives,
+    parse_http_date,
+    try_int,
 )
 from requests_cache.models.response import CachedResponse
 from tests.conftest import ETAG, HTTPDATE_DATETIME, HTTPDATE_STR, LAST_MODIFIED
@@ -57,6 +63,23 @@ def test_init(
     assert actions.expire_after == expected_expiration
 
 
+@patch('requests_cache.cache_control.get_url_expiration')
+def test_init__skip_url_expiration(get_url_expiration):
+    """URL patterns don't need to be checked if there is a higher-precedence expiration value"""
+    request = PreparedRequest()
+    request.url = 'https://img.site.com/base/img.jpg'
+    request.headers = {'Cache-Control': 'max-age=60'}
+
+    actions = CacheActions.from_request(
+        cache_key='key',
+        request=request,
+        urls_expire_after={'*.site.com': 1},
+        session_expire_after=1,
+    )
+    assert actions.expire_after == 60
+    get_url_expiration.assert_not_called()
+
+
 @pytest.mark.parametrize(
     'headers, expected_expiration',
     [
@@ -158,6 +181,32 @@ def test_init_from_settings_and_headers(
     assert actions.skip_read == expected_skip_read
 
 
+@pytest.mark.parametrize(
+    'request_expire_after, refresh, expected_skip_read, expected_skip_write',
+    [
+        (None, False, False, False),
+        (None, True, True, False),
+        (60, False, False, False),
+        (0, False, True, True),
+    ],
+)
+def test_init_without_headers(
+    request_expire_after, refresh, expected_skip_read, expected_skip_write
+):
+    """Without any request headers or URL patterns to check, only keyword args should apply"""
+    actions = CacheActions.from_request(
+        cache_key='key',
+        request=PreparedRequest(),
+        session_expire_after=1,
+        request_expire_after=request_expire_after,
+        refresh=refresh,
+    )
+    expected_expiration = 1 if request_expire_after is None else request_expire_after
+    assert actions.expire_after == expected_expiration
+    assert actions.skip_read is expected_skip_read
+    assert actions.skip_write is expected_skip_write
+
+
 @pytest.mark.parametrize(
     'response_headers, expected_validation_headers',
     [
@@ -300,6 +349,69 @@ def test_ignored_headers(directive):
     assert actions.skip_write is False
 
 
+@pytest.mark.parametrize(
+    'headers, expected_directives',
+    [
+        ({}, {}),
+        ({'Content-Type': 'text/plain'}, {}),
+        ({'Cache-Control': 'no-cache'}, {'no-cache': True}),
+        (
+            {'Cache-Control': 'public, max-age=60 ,must-revalidate'},
+            {'public': True, 'max-age': 60, 'must-revalidate': True},
+        ),
+        ({'Cache-Control': 'max-age=abc'}, {'max-age': None}),
+        ({'Expires': HTTPDATE_STR}, {'expires': HTTPDATE_STR}),
+    ],
+)
+def test_get_cache_directives(headers, expected_directives):
+    assert get_cache_directives(headers) == expected_directives
+
+
+def test_parse_cache_directives__flags():
+    """Key-only directives should also be returned as bit flags"""
+    headers = {'Cache-Control': 'public, no-cache, max-age=0, must-revalidate'}
+    directives, flags = parse_cache_directives(headers)
+    assert directives == {'public': True, 'no-cache': True, 'max-age': 0, 'must-revalidate': True}
+    assert flags == 1 | 16
+    assert parse_cache_directives({}) == ({}, 0)
+
+
+@pytest.mark.parametrize(
+    'value, expected_datetime',
+    [
+        (HTTPDATE_STR, HTTPDATE_DATETIME),
+        ('Thu, 05 Jul 2012 15:31:30 GMT', datetime(2012, 7, 5, 15, 31, 30)),
+        ('Thu, 05 Jul 2012 17:31:30 +0200', datetime(2012, 7, 5, 15, 31, 30)),  # Non-GMT
+        ('Thursday, 05-Jul-12 15:31:30 GMT', datetime(2012, 7, 5, 15, 31, 30)),  # RFC 850
+        ('Thu, 35 Jul 2012 15:31:30 GMT', None),
+        ('Thu, 05 Foo 2012 15:31:30 GMT', None),
+        ('0', None),
+    ],
+)
+def test_parse_http_date(value, expected_datetime):
+    assert parse_http_date(value) == expected_datetime
+
+
+@pytest.mark.parametrize(
+    'value, expected_value',
+    [
+        (60, 60),
+        (33.3, 33),
+        ('60', 60),
+        (' -1 ', -1),
+        ('+5', 5),
+        ('', None),
+        ('must-revalidate', None),
+        ('1.5', None),
+        (HTTPDATE_STR, None),
+        (None, None),
+        (timedelta(seconds=60), None),
+    ],
+)
+def test_try_int(value, expected_value):
+    assert try_int(value) == expected_value
+
+
 @patch('requests_cache.cache_control.datetime')
 def test_get_expiration_datetime__no_expiration(mock_datetime):
     assert get_expiration_datetime(None) is None
@@ -322,6 +434,14 @@ def test_get_expiration_datetime__relative(expire_after, expected_expiration_del
     assert abs((expires - expected_expiration).total_seconds()) <= 1
 
 
+def test_get_expiration_datetime__now():
+    """If the current time is provided, it should be used instead of sampling the clock again"""
+    now = datetime(2021, 2, 1, 12, 0)
+    assert get_expiration_datetime(DO_NOT_CACHE, now) == now
+    assert get_expiration_datetime(60, now) == now + timedelta(seconds=60)
+    assert get_expiration_seconds(timedelta(minutes=1), now) == 60
+
+
 def test_get_expiration_datetime__tzinfo():
     tz = timezone(-timedelta(hours=5))
     dt = datetime(2021, 2, 1, 7, 0, tzinfo=tz)
@@ -376,3 +496,57 @@ def test_get_url_expiration__evaluation_order(url, expected_expire_after):
         '*': 1,
     }
     assert get_url_expiration(url, urls_expire_after) == expected_expire_after
+
+
+@pytest.mark.parametrize(
+    'url, expected_expire_after',
+    [
+        ('https://site_1.com:8080/resource', 1),
+        ('https://site_1.com?param=value', 1),
+        ('site_1.com#fragment', 1),
+        ('https://img.cdn.site_2.com/image.jpeg', 2),
+        ('https://site_3.com/api/v1/users', 3),
+        ('https://site_3.com/api/v2/users', 4),
+        ('https://site_3.com.evil.com/api/v1/users', 4),
+        ('site_3.com/static', 5),
+    ],
+)
+def test_url_pattern_set(url, expected_expire_after):
+    """Patterns indexed by host, by host suffix, and not indexed at all should all be checked in the
+    order they were defined
+    """
+    patterns = UrlPatternSet(
+        {
+            'site_1.com': 1,
+            '*.site_2.com': 2,
+            'site_3.com/api/v1': 3,
+            '*/api': 4,
+            'http*://site_3.com/static': 5,
+        }
+    )
+    assert patterns.get_expiration(url) == expected_expire_after
+
+
+@pytest.mark.parametrize(
+    'url, expected_expire_after',
+    [
+        ('https://site_1.com/img/logo.png', 1),
+        ('https://site_1.com/static/logo.png', 2),
+        ('https://site_2.com/static/logo.png', 3),
+        ('https://site_2.com/static/logo.jpg', 4),
+        ('https://site_3.com/index.html', None),
+    ],
+)
+def test_url_pattern_set__combined_wildcards(url, expected_expire_after):
+    """Patterns that can't be indexed by host should still be checked in the order they were
+    defined, relative to each other and to indexed patterns
+    """
+    patterns = UrlPatternSet(
+        {
+            'site_?.com/img': 1,
+            'site_1.com/static': 2,
+            '*/static/*.png': 3,
+            '*/static': 4,
+        }
+    )
+    assert patterns.get_expiration(url) == expected_expire_after
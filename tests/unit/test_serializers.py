@@ -17,10 +17,13 @@ from requests_cache import (
     CachedSession,
     SerializerPipeline,
     Stage,
+    bson_serializer,
     json_serializer,
     safe_pickle_serializer,
     utf8_encoder,
+    yaml_serializer,
 )
+from tests.conftest import MOCKED_URL_REDIRECT, MOCKED_URL_REDIRECT_TARGET
 
 
 def test_stdlib_json():
@@ -106,3 +109,24 @@ def test_plain_pickle(tempfile_path):
     session.cache.responses['key'] = response
     assert session.cache.responses['key'] == response
     assert session.cache.responses['key'].expires is None
+
+
+@pytest.mark.parametrize('serializer', [bson_serializer, json_serializer, yaml_serializer])
+@pytest.mark.parametrize('cache_target', [False, True])
+def test_redirect_history(mock_session, serializer, cache_target):
+    """Responses with redirect history should be serializable with formats other than pickle. This
+    includes a redirect that ends in a cached response, which requests gives plain Response history.
+    """
+    if not isinstance(serializer, SerializerPipeline):
+        pytest.skip(f'Dependencies not installed for {serializer}')
+    if cache_target:
+        mock_session.get(MOCKED_URL_REDIRECT_TARGET)
+    response = mock_session.get(MOCKED_URL_REDIRECT)
+    assert response.from_cache is cache_target
+
+    cached_response = CachedResponse.from_response(response)
+    new_response = serializer.loads(serializer.dumps(cached_response))
+    assert len(new_response.history) == 1
+    assert isinstance(new_response.history[0], CachedResponse)
+    assert new_response.history[0].url == MOCKED_URL_REDIRECT
+    assert new_response.url == MOCKED_URL_REDIRECT_TARGET
@@ -528,6 +528,17 @@ def test_url_allowlist(mock_session):
     assert mock_session.get(MOCKED_URL).from_cache is False
 
 
+def test_url_allowlist__modified_in_place(mock_session):
+    """Changes to urls_expire_after made in place (instead of reassigning it) should also be used"""
+    mock_session.urls_expire_after = {MOCKED_URL_JSON: 0}
+    mock_session.get(MOCKED_URL_JSON)
+    assert mock_session.get(MOCKED_URL_JSON).from_cache is False
+
+    mock_session.urls_expire_after[MOCKED_URL_JSON] = 60
+    mock_session.get(MOCKED_URL_JSON)
+    assert mock_session.get(MOCKED_URL_JSON).from_cache is True
+
+
 def test_remove_expired_responses(mock_session):
     unexpired_url = f'{MOCKED_URL}?x=1'
     mock_session.mock_adapter.register_uri(
@@ -744,6 +755,20 @@ def test_request_revalidate(mock_session):
     assert response_2.expires < response_4.expires
 
 
+def test_request_revalidate__saved_in_place(mock_session):
+    """After a 304 response, the cached response should be updated and saved without a copy"""
+    mock_session.get(MOCKED_URL_ETAG, expire_after=60)
+    mock_session.mock_adapter.register_uri('GET', MOCKED_URL_ETAG, status_code=304)
+
+    with patch.object(
+        mock_session.cache, 'save_response', wraps=mock_session.cache.save_response
+    ) as save_response:
+        response = mock_session.get(MOCKED_URL_ETAG, revalidate=True, expire_after=60)
+    save_response.assert_called_once_with(
+        response, response.cache_key, response.expires, copy=False
+    )
+
+
 def test_request_revalidate__no_validator(mock_session):
     """The revalidate option should have no effect if the cached response has no validator"""
     response_1 = mock_session.get(MOCKED_URL, expire_after=60)